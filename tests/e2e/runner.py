@@ -0,0 +1,569 @@
+#!/usr/bin/env python3
+"""OmniScribe E2E suites, run against one shared browser and loaded app
+
+Usage: runner.py [full] [local] [console] [recording]  (default: all)
+
+Env: SCREENSHOTS=1 saves JPEGs to /tmp, VERBOSE=1 echoes console and error
+events, FAST=1 also skips images, fonts and media.
+"""
+
+from playwright.async_api import async_playwright, expect
+import asyncio
+import json
+import os
+import re
+import sys
+
+URL = 'https://omniscribe.vercel.app'
+VIEWPORT = {'width': 390, 'height': 844}  # iPhone 12 Pro size
+STATE_PATH = '/tmp/omniscribe-e2e-state.json'
+
+# Third-party and debug assets the tests never exercise; a regex so Playwright
+# aborts them without a round trip to a Python route handler
+BLOCKED_URL_PARTS = ('vercel-insights', 'google-analytics', 'fonts.googleapis', 'fonts.gstatic')
+BLOCKED_URL_RE = re.compile('|'.join(map(re.escape, BLOCKED_URL_PARTS)) + r'|\.map([?#]|$)')
+# Only skipped with FAST=1, since screenshots otherwise need them
+FAST_BLOCKED_TYPES = ('image', 'font', 'media')
+
+expect.set_options(timeout=5000)
+
+def _is_fast_blocked(request):
+    return bool(os.environ.get('FAST') and request.resource_type in FAST_BLOCKED_TYPES)
+
+def is_blocked(request):
+    """Whether the harness aborts this request (so its failure is expected)"""
+    return bool(BLOCKED_URL_RE.search(request.url)) or _is_fast_blocked(request)
+
+def _print_console(msg):
+    print(f"[CONSOLE {msg.type.upper()}] {msg.text}")
+
+def _print_page_error(error):
+    print(f"[PAGE ERROR] {error}")
+
+def _print_request_failed(request):
+    if not is_blocked(request):
+        print(f"[REQUEST FAILED] Failed: {request.url} - {request.failure}")
+
+def _overlay(page, marker):
+    # Settings and the recorder are full-screen overlays that cover the app
+    # header, so their controls must be looked up inside the overlay itself
+    return page.locator('div.fixed.inset-0.z-50', has=marker)
+
+
+class E2EHarness:
+    """Owns the browser, context and main page shared by every suite"""
+
+    def __init__(self):
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+        self.console_logs = []
+        self.page_errors = []
+        self.failed_requests = []
+        self._fast_aborted = set()
+        self._boot_counts = (0, 0, 0)
+
+    async def __aenter__(self):
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=True)
+        options = {}
+        if os.path.exists(STATE_PATH):
+            options['storage_state'] = STATE_PATH
+        self.context = await self.browser.new_context(
+            base_url=URL,
+            viewport=VIEWPORT,
+            permissions=['microphone'],
+            **options,
+        )
+        await self.context.route(BLOCKED_URL_RE, lambda route: route.abort())
+        if os.environ.get('FAST'):
+            # Resource types aren't visible to a URL matcher; registered last,
+            # so this handler sees requests first and falls back for the rest
+            await self.context.route('**/*', self._filter_fast)
+        self.page = await self.new_page()
+        return self
+
+    async def _filter_fast(self, route):
+        if _is_fast_blocked(route.request):
+            self._fast_aborted.add(route.request.url)
+            await route.abort()
+        else:
+            await route.fallback()
+
+    def is_blocked_url(self, url):
+        """Whether the harness aborted requests to this URL"""
+        return bool(url) and (bool(BLOCKED_URL_RE.search(url)) or url in self._fast_aborted)
+
+    async def __aexit__(self, *exc_info):
+        await self.context.close()
+        await self.browser.close()
+        await self.playwright.stop()
+
+    async def new_page(self):
+        """Open a page whose events feed the shared logs"""
+        page = await self.context.new_page()
+        page.on('console', self.console_logs.append)
+        page.on('pageerror', self.page_errors.append)
+        page.on('requestfailed', self.failed_requests.append)
+        if os.environ.get('VERBOSE'):
+            page.on('console', _print_console)
+            page.on('pageerror', _print_page_error)
+            page.on('requestfailed', _print_request_failed)
+        return page
+
+    def mark_boot(self):
+        """Keep everything logged so far (app startup) in every suite's report"""
+        self._boot_counts = (len(self.console_logs), len(self.page_errors), len(self.failed_requests))
+
+    def clear_logs(self):
+        """Drop what the previous suite logged, keeping startup entries"""
+        console, errors, failed = self._boot_counts
+        del self.console_logs[console:]
+        del self.page_errors[errors:]
+        del self.failed_requests[failed:]
+
+    def console_messages(self, msg_type):
+        # Aborted requests log "Failed to load resource" against their own URL
+        return [
+            msg for msg in self.console_logs
+            if msg.type == msg_type and not self.is_blocked_url((msg.location or {}).get('url'))
+        ]
+
+    def network_errors(self):
+        return [f"PAGE: {error}" for error in self.page_errors] + [
+            f"REQUEST: {request.url} - {request.failure}"
+            for request in self.failed_requests
+            if not is_blocked(request)
+        ]
+
+    async def load_app(self, page=None):
+        """Navigate to the app and wait for the tab bar rather than network idle"""
+        page = page or self.page
+        await page.goto(URL, wait_until='domcontentloaded', timeout=10000)
+        await page.locator('nav button').first.wait_for(state='visible', timeout=5000)
+
+    async def save_state(self):
+        """Persist cookies/localStorage so later runs start warm"""
+        await self.context.storage_state(path=STATE_PATH)
+
+    async def open_settings(self, page=None):
+        page = page or self.page
+        await page.locator('header button').last.click()
+        await expect(page.get_by_role('heading', name='Settings', exact=True), "Expected 'Settings' header").to_be_visible()
+
+    async def close_settings(self, page=None):
+        page = page or self.page
+        settings = _overlay(page, page.get_by_role('heading', name='Settings', exact=True))
+        await settings.get_by_role('button').first.click()  # Header X
+        await expect(page.get_by_role('heading', name='Settings', exact=True)).to_be_hidden()
+
+    async def open_recorder(self, page=None):
+        page = page or self.page
+        await page.locator('nav button').nth(2).click()  # Center record button
+        await expect(page.get_by_text('REC', exact=True), "Expected 'REC' indicator").to_be_visible()
+
+    async def close_recorder(self, page=None):
+        page = page or self.page
+        recorder = _overlay(page, page.get_by_text('REC', exact=True))
+        await recorder.get_by_role('button').first.click()  # Header X
+        await expect(page.get_by_text('REC', exact=True)).to_be_hidden()
+
+    async def check_api(self, path):
+        """GET an API endpoint without a renderer and return its JSON body"""
+        response = await self.context.request.get(path)
+        assert response.status == 200, f"Expected 200 from {path}, got {response.status}"
+        return await response.json()
+
+    async def screenshot(self, name, page=None):
+        """Save /tmp/<name>.jpg when SCREENSHOTS=1 and return its path"""
+        if not os.environ.get('SCREENSHOTS'):
+            return None
+        page = page or self.page
+        path = f'/tmp/{name}.jpg'
+        await page.screenshot(path=path, type='jpeg', quality=60)
+        return path
+
+
+class TestFull:
+    """All non-microphone features"""
+
+    title = "OMNISCRIBE E2E TEST SUITE"
+
+    async def test_load_app(self, h):
+        title = await h.page.title()
+        assert title == 'OmniScribe V2', f"Expected title 'OmniScribe V2', got '{title}'"
+        print("\n[TEST 1] Load App")
+        print("  ✓ App loads correctly")
+
+    async def test_home_view(self, h):
+        await expect(h.page.get_by_text('No recordings yet'), "Expected 'No recordings yet' text").to_be_visible()
+        print("\n[TEST 2] Home View")
+        print("  ✓ Home view shows empty state")
+
+    async def test_views(self, h):
+        # Tab switches on the loaded page are cheaper than extra full SPA
+        # loads, so only the renderer-free API check runs alongside them.
+        # A TaskGroup cancels it if a view check fails first.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                api = tg.create_task(self.check_api(h))
+                await self.check_folders(h, h.page)
+                await self.check_search(h, h.page)
+                await self.check_actions(h, h.page)
+                await self.check_settings(h, h.page)
+                await api
+                await self.check_record(h, h.page)
+        except ExceptionGroup as group:
+            # Report the first failing check rather than the group wrapper
+            raise group.exceptions[0]
+
+    async def check_folders(self, h, page):
+        await page.locator('nav button').nth(1).click()  # Folders tab
+        await expect(page.get_by_role('heading', name='Folders', exact=True), "Expected 'Folders' header").to_be_visible()
+        await expect(page.get_by_text('Personal', exact=True).first, "Expected 'Personal' folder").to_be_visible()
+        await expect(page.get_by_text('Work', exact=True).first, "Expected 'Work' folder").to_be_visible()
+        await expect(page.get_by_text('Ideas', exact=True).first, "Expected 'Ideas' folder").to_be_visible()
+        shot = await h.screenshot('test-folders', page)
+        print("\n[TEST 3] Folders Tab")
+        print("  ✓ Folders view displays correctly")
+        if shot:
+            print(f"  Screenshot saved: {shot}")
+
+    async def check_search(self, h, page):
+        await page.locator('nav button').nth(3).click()  # Search tab
+        await expect(page.get_by_placeholder('Search transcripts'), "Expected 'Search' in view").to_be_visible()
+        shot = await h.screenshot('test-search', page)
+        print("\n[TEST 4] Search Tab")
+        print("  ✓ Search view loads")
+        if shot:
+            print(f"  Screenshot saved: {shot}")
+
+    async def check_actions(self, h, page):
+        await page.locator('nav button').nth(4).click()  # Actions tab
+        await expect(page.get_by_role('heading', name='Actions', exact=True), "Expected Actions view").to_be_visible()
+        shot = await h.screenshot('test-actions', page)
+        print("\n[TEST 5] Actions Tab")
+        print("  ✓ Actions view loads")
+        if shot:
+            print(f"  Screenshot saved: {shot}")
+
+    async def check_settings(self, h, page):
+        await h.open_settings(page)
+        shot = await h.screenshot('test-settings', page)
+        await h.close_settings(page)
+        print("\n[TEST 6] Settings")
+        print("  ✓ Settings view loads")
+        if shot:
+            print(f"  Screenshot saved: {shot}")
+
+    async def check_api(self, h):
+        notes_data, parsers_data = await asyncio.gather(
+            h.check_api('/api/notes'),
+            h.check_api('/api/parsers'),
+        )
+        assert 'notes' in notes_data, "Expected 'notes' key in response"
+        assert 'parsers' in parsers_data, "Expected 'parsers' key in response"
+        print("\n[TEST 7] API Endpoints")
+        print(f"  ✓ GET /api/notes - 200 OK ({len(notes_data['notes'])} notes)")
+        print(f"  ✓ GET /api/parsers - 200 OK ({len(parsers_data['parsers'])} parsers)")
+
+    async def check_record(self, h, page):
+        await h.open_recorder(page)
+        await expect(page.get_by_text('Raw', exact=True).first, "Expected parser options").to_be_visible()
+        shot = await h.screenshot('test-record-ui', page)
+        await h.close_recorder(page)
+        print("\n[TEST 8] Record UI")
+        print("  ✓ Record UI opens correctly")
+        if shot:
+            print(f"  Screenshot saved: {shot}")
+
+    def summary(self, h):
+        errors = h.network_errors()
+        if errors:
+            print(f"\n❌ ERRORS FOUND: {len(errors)}")
+            for err in errors:
+                print(f"  - {err[:100]}")
+        else:
+            print("\n✅ ALL TESTS PASSED")
+
+
+class TestLocalMode:
+    """Pure local/web mode (no cloud)"""
+
+    title = "TESTING LOCAL-ONLY MODE"
+    _listener = None
+
+    async def test_load_app(self, h):
+        print("\n[1] Loading app...")
+        # The harness loaded it already, so replay what startup logged before
+        # echoing the rest of the suite live
+        for msg in h.console_logs:
+            self._echo_console(h, msg)
+        self._listener = lambda msg: self._echo_console(h, msg)
+        h.page.on('console', self._listener)
+
+    async def test_cloud_detection(self, h):
+        print("\n[2] Checking cloud/local mode detection...")
+
+        # Go to settings to see sync status
+        await h.open_settings()
+        if await h.page.get_by_text('Supabase Sync').count():
+            if await h.page.get_by_text('Connected').count():
+                print("  - Cloud mode: Supabase connected")
+            else:
+                print("  - Local mode: Supabase not connected")
+
+        # Check for Gemini API key requirement
+        print("\n[3] Checking local transcription capability...")
+
+        # The geminiService requires VITE_GEMINI_API_KEY
+        # In production build, this would be baked in at build time
+        if shot := await h.screenshot('local-mode-settings'):
+            print(f"Screenshot saved: {shot}")
+        await h.close_settings()
+
+    async def test_recorder_opens(self, h):
+        print("\n[4] Testing recorder opens locally...")
+        try:
+            await h.open_recorder()
+            await expect(h.page.get_by_text('Raw', exact=True).first).to_be_visible()
+        except AssertionError:
+            print("  ✗ Recorder UI failed")
+        else:
+            print("  ✓ Recorder UI works")
+        if shot := await h.screenshot('local-mode-recorder'):
+            print(f"Screenshot saved: {shot}")
+
+        # Close it even without parser options, so later suites start clean
+        if await h.page.get_by_text('REC', exact=True).is_visible():
+            await h.close_recorder()
+
+    def _echo_console(self, h, msg):
+        if os.environ.get('VERBOSE') or h.is_blocked_url((msg.location or {}).get('url')):
+            return  # Already echoed, or an expected abort
+        if msg.type == 'error':
+            print(f"[ERROR] {msg.text}")
+        elif msg.type == 'warning' and ('supabase' in msg.text.lower() or 'cloud' in msg.text.lower()):
+            print(f"[WARN] {msg.text}")
+
+    def summary(self, h):
+        if self._listener:
+            h.page.remove_listener('console', self._listener)
+        errors = [msg.text for msg in h.console_messages('error')]
+        cloud_errors = [e for e in errors if 'supabase' in e.lower() or 'cloud' in e.lower() or 'sync' in e.lower()]
+        gemini_errors = [e for e in errors if 'gemini' in e.lower() or 'api' in e.lower()]
+
+        print(f"\nCloud-related errors: {len(cloud_errors)}")
+        for e in cloud_errors:
+            print(f"  - {e[:100]}")
+
+        print(f"\nGemini API errors: {len(gemini_errors)}")
+        for e in gemini_errors:
+            print(f"  - {e[:100]}")
+
+        print(f"\nTotal console errors: {len(errors)}")
+        print(f"Total console warnings: {len(h.console_messages('warning'))}")
+
+
+class TestConsole:
+    """Page content analysis plus captured console logs and errors"""
+
+    title = "PAGE CONTENT ANALYSIS"
+
+    async def test_page_content(self, h):
+        page = h.page
+        if shot := await h.screenshot('omniscribe-home'):
+            print(f"Screenshot saved: {shot}")
+        print(f"Page title: {await page.title()}")
+
+        print("\n--- Looking for key UI elements ---")
+        if await page.locator('header').first.is_visible():
+            print("✓ Header found")
+        print(f"Record buttons found: {await page.get_by_role('button', name='Record').count()}")
+        print(f"Buttons with icons: {await page.locator('button:has(svg)').count()}")
+        print(f"Tab/nav buttons: {await page.locator('nav button').count()}")
+        print(f"Total buttons on page: {await page.locator('button').count()}")
+
+        print("\n--- Visible text on page ---")
+        body_text = await page.locator('body').inner_text()
+        print(body_text[:500])
+
+    async def test_record_button(self, h):
+        print("\n=== TESTING RECORD BUTTON ===")
+        try:
+            await h.open_recorder()
+        except AssertionError as e:
+            print(f"Could not open recorder: {e}")
+            return
+
+        if shot := await h.screenshot('omniscribe-recording'):
+            print(f"Screenshot saved: {shot}")
+        await h.close_recorder()
+
+    async def test_api_endpoint(self, h):
+        print("\n=== TESTING API ENDPOINT ===")
+        response = await h.context.request.get('/api/notes')
+        print(f"API /notes response status: {response.status}")
+        if response.status == 200:
+            try:
+                api_data = await response.json()
+                print(f"API response: {json.dumps(api_data, indent=2)[:500]}")
+            except ValueError:
+                print(f"API response text: {(await response.text())[:500]}")
+
+    def summary(self, h):
+        errors = h.console_messages('error')
+        network_errors = h.network_errors()
+        print(f"Console errors: {len(errors)}")
+        print(f"Console warnings: {len(h.console_messages('warning'))}")
+        print(f"Network errors: {len(network_errors)}")
+
+        if errors:
+            print("\n--- ERRORS DETAIL ---")
+            for err in errors:
+                location = err.location
+                if location and location.get('url'):
+                    print(f"  - {err.text} ({location['url']}:{location['lineNumber']})")
+                else:
+                    print(f"  - {err.text}")
+
+        if network_errors:
+            print("\n--- NETWORK ERRORS DETAIL ---")
+            for err in network_errors:
+                print(f"  - {err}")
+
+
+class TestRecording:
+    """Recording flow; runs last since it saves a note"""
+
+    title = "RECORDING FLOW"
+
+    async def test_record_and_stop(self, h):
+        page = h.page
+        mic_button = page.locator('nav button').nth(2)  # Center button (index 2 of 5)
+        if not await mic_button.is_visible():
+            print("✗ Could not find record button")
+            return
+
+        print("✓ Found record button in tab bar")
+        button_box = await mic_button.bounding_box()
+        print(f"  Position: x={button_box['x']:.0f}, y={button_box['y']:.0f}")
+        print(f"  Size: {button_box['width']:.0f}x{button_box['height']:.0f}")
+
+        print("\n=== STARTING RECORDING ===")
+        try:
+            await h.open_recorder()
+            print("✓ REC indicator visible - recording started")
+        except AssertionError:
+            print("✗ REC indicator not found")
+        if shot := await h.screenshot('omniscribe-recorder-opened'):
+            print(f"Screenshot saved: {shot}")
+
+        print("\n--- Recording UI text ---")
+        print((await page.locator('body').inner_text())[:800])
+
+        timer = page.locator('text=/\\d+:\\d+/').first
+        if await timer.is_visible():
+            print(f"✓ Timer visible: {await timer.inner_text()}")
+        else:
+            print("✗ Timer not found")
+        print(f"  Control buttons visible: {await page.locator('button:has(svg)').count()}")
+
+        # Wait a bit to let it record
+        print("\n=== RECORDING FOR 3 SECONDS ===")
+        await asyncio.sleep(3)
+        if shot := await h.screenshot('omniscribe-recording-3s'):
+            print(f"Screenshot saved: {shot}")
+
+        # Try to stop recording by clicking the green check button
+        print("\n=== STOPPING RECORDING ===")
+        stop_btn = page.locator('button').last
+        if not await stop_btn.is_visible():
+            return
+        await stop_btn.click()
+        print("Clicked stop button")
+
+        # The recorder closes and the new note shows "Processing..." until
+        # transcription resolves, so wait on that instead of a fixed delay
+        try:
+            await expect(page.get_by_text('REC', exact=True)).to_be_hidden()
+            await expect(page.get_by_text('Processing...')).to_have_count(0, timeout=15000)
+            print("✓ Processing finished")
+        except AssertionError:
+            print("✗ Processing did not finish within 15s")
+        if shot := await h.screenshot('omniscribe-after-stop'):
+            print(f"Screenshot saved: {shot}")
+
+    def summary(self, h):
+        errors = h.console_messages('error')
+        print(f"Console errors: {len(errors)}")
+        print(f"Console warnings: {len(h.console_messages('warning'))}")
+        print(f"Network errors: {len(h.network_errors())}")
+
+        if errors:
+            print("\n--- ERRORS ---")
+            for err in errors[:10]:  # First 10 errors
+                print(f"  {err.text[:200]}")
+
+
+# Run order matters: the full suite expects no saved recordings
+SUITES = {
+    'full': TestFull,
+    'local': TestLocalMode,
+    'console': TestConsole,
+    'recording': TestRecording,
+}
+
+async def run_suite(h, suite):
+    print("\n" + "=" * 50)
+    print(suite.title)
+    print("=" * 50)
+
+    h.clear_logs()
+    failure = None
+    for name, method in vars(type(suite)).items():
+        if not name.startswith('test_'):
+            continue
+        try:
+            await method(suite, h)
+        except Exception as e:
+            failure = f"{name}: {type(e).__name__}: {str(e)[:200]}"
+            print(f"\n✗ {failure}")
+            break
+
+    print("\n--- SUMMARY ---")
+    suite.summary(h)
+    return failure
+
+async def main(names):
+    unknown = set(names) - set(SUITES)
+    if unknown:
+        print(f"Unknown suites: {', '.join(sorted(unknown))} (choose from {', '.join(SUITES)})")
+        return 2
+    selected = [name for name in SUITES if not names or name in names]
+
+    results = {}
+    async with E2EHarness() as h:
+        await h.load_app()
+        await h.save_state()
+        # The tab bar shows before init() finishes seeding the DB and syncing
+        # parsers, so let startup traffic settle before fencing off its logs
+        await h.page.wait_for_load_state('networkidle')
+        h.mark_boot()
+        for name in selected:
+            results[name] = await run_suite(h, SUITES[name]())
+            if results[name]:
+                # Don't let a half-finished suite leak UI state into the next
+                await h.load_app()
+
+    print("\n" + "=" * 50)
+    print("RUNNER SUMMARY")
+    print("=" * 50)
+    for name, failure in results.items():
+        print(f"  ✗ {name}: {failure}" if failure else f"  ✓ {name}")
+
+    return 1 if any(results.values()) else 0
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main(sys.argv[1:])))